@@ -0,0 +1,174 @@
+"""asyncio front-end for driving many games from a single thread.
+
+MAX graphs release the GIL while executing, so blocking `execute()` calls are
+dispatched to a small bounded thread pool and awaited. Games are plain
+coroutines. They funnel their evaluation requests through a shared
+`BatchEvaluator`, which groups them into batches. This lets a single process run
+thousands of lightweight games without a thread per game.
+
+Example:
+    ```python
+    play = AsyncModel(session.load(play_graph))
+    evaluator = BatchEvaluator(evaluate_batch, max_batch_size=256)
+
+    async def play_game(i: int):
+        g = (await init.run())[0]
+        while ...:
+            policy = await evaluator(state)
+            valid, terminal = await play.run(action, g)
+
+    results = asyncio.run(run_games(play_game, num_games=4096))
+    ```
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+from max.engine import Model  # pyright: ignore[reportPrivateImportUsage]
+
+from alpha_max_zero import trace
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncModel:
+    """Awaitable wrapper around a model from `InferenceSession.load`.
+
+    Each `run` is executed on a bounded thread pool so the event loop stays free
+    while the graph executes.
+    """
+
+    def __init__(
+        self, model: Model, executor: Executor | None = None, max_workers: int = 4
+    ) -> None:
+        """
+        Args:
+            model: The loaded model to execute.
+            executor: Executor to dispatch to. Allows sharing one pool between
+                      models. If None, a pool with `max_workers` threads is created
+                      and owned by this wrapper.
+            max_workers: Size of the owned thread pool.
+        """
+        self.model = model
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers)
+
+    async def run(self, *inputs: Any) -> list[Any]:
+        """Execute the model without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.model.execute, *inputs)
+
+    def close(self) -> None:
+        """Shut down the thread pool if it is owned by this wrapper."""
+        if self._owns_executor:
+            self.executor.shutdown()
+
+
+class BatchEvaluator(Generic[T, R]):
+    """Global batching point for evaluation requests from many coroutines.
+
+    Each `await evaluator(item)` queues the item. A batch is flushed once it holds
+    `max_batch_size` items or `max_wait` seconds after its first item arrived.
+    With the default `max_wait` of 0, a batch is flushed as soon as every ready
+    coroutine had a chance to queue a request.
+    """
+
+    def __init__(
+        self,
+        evaluate_batch: Callable[[list[T]], Awaitable[list[R]]],
+        max_batch_size: int = 256,
+        max_wait: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            evaluate_batch: Evaluates a batch of items, returning one result per item.
+            max_batch_size: Flush once this many items are queued.
+            max_wait: Max seconds to wait for a batch to fill before flushing.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        self.evaluate_batch = evaluate_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def __call__(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            if self.max_wait > 0:
+                self._timer = loop.call_later(self.max_wait, self._flush)
+            else:
+                self._timer = loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = []
+        task = asyncio.ensure_future(self._evaluate(batch))
+        # Keep a reference so the task is not garbage collected mid flight.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _evaluate(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            # Several batches can be in flight at once on the event loop thread.
+            with trace.async_span("batch_evaluate", batch_size=len(batch)):
+                results = await self.evaluate_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"evaluate_batch returned {len(results)} results "
+                    f"for a batch of {len(batch)}"
+                )
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # On cancellation (or any other BaseException), no result was set.
+            # Cancel the callers instead of leaving them waiting forever.
+            for _, future in batch:
+                future.cancel()
+
+
+async def run_games(
+    play_game: Callable[[int], Awaitable[R]],
+    num_games: int,
+    max_concurrency: int | None = None,
+) -> list[R]:
+    """Run `play_game(i)` for each game index concurrently and gather the results.
+
+    Args:
+        play_game: Coroutine function that plays a single game.
+        num_games: Number of games to play.
+        max_concurrency: Max games in flight at once. If None, all games start
+                         immediately.
+    """
+    if max_concurrency is None:
+        return list(await asyncio.gather(*(play_game(i) for i in range(num_games))))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(i: int) -> R:
+        async with semaphore:
+            return await play_game(i)
+
+    return list(await asyncio.gather(*(bounded(i) for i in range(num_games))))
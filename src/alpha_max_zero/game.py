@@ -7,6 +7,7 @@ The game implementations are in src/alpha_max_zero/games/...
 """
 
 from abc import ABC, abstractmethod
+from typing import Sequence, TypeVar
 
 from max.dtype import DType
 from max.graph import (
@@ -19,6 +20,10 @@ from max.graph import (
     Value,
 )
 
+from alpha_max_zero.random import PCGRandom
+
+G = TypeVar("G", bound="Game")
+
 
 class Game(ABC):
     """Base class for all games managed in the graph.
@@ -53,6 +58,12 @@ class Game(ABC):
         """Returns the number of actions possible in the game."""
         ...
 
+    @staticmethod
+    @abstractmethod
+    def serialized_size() -> int:
+        """Returns the number of bytes in a serialized game."""
+        ...
+
     def __init__(self, opaque_value: Value | None = None) -> None:
         if opaque_value:
             assert isinstance(opaque_value, _OpaqueValue)
@@ -123,6 +134,189 @@ class Game(ABC):
             ],
         )[0].tensor
 
+    @classmethod
+    def mask_words(cls) -> int:
+        """Returns the number of uint64 words in a valid action bitmask."""
+        return (cls.num_actions() + 63) // 64
+
+    def valid_actions_mask(self) -> TensorValue:
+        """Get valid actions packed as a uint64 bitmask of shape [mask_words].
+
+        Action `a` is bit `a % 64` of word `a // 64`.
+        """
+        return ops.inplace_custom(
+            name=f"alpha_max_zero.games.{self.custom_op_name()}.valid_actions_mask",
+            device=DeviceRef.CPU(),
+            values=[self.value],
+            out_types=[
+                TensorType(
+                    dtype=DType.uint64,
+                    shape=(self.mask_words(),),
+                    device=DeviceRef.CPU(),
+                )
+            ],
+        )[0].tensor
+
+    def terminal_mask(self) -> TensorValue:
+        """Check if the game has ended, packed as a uint32 scalar.
+
+        Bit N is set if player N won and bit num_players is set for a tie.
+        Zero means the game is not over.
+        """
+        return ops.inplace_custom(
+            name=f"alpha_max_zero.games.{self.custom_op_name()}.terminal_mask",
+            device=DeviceRef.CPU(),
+            values=[self.value],
+            out_types=[
+                TensorType(dtype=DType.uint32, shape=(), device=DeviceRef.CPU())
+            ],
+        )[0].tensor
+
+    @classmethod
+    def batch_valid_actions_mask(cls, games: Value) -> TensorValue:
+        """Valid action bitmasks of shape [N, mask_words] for N serialized games."""
+        games = cls._check_serialized_batch(games)
+        return ops.custom(
+            name=f"alpha_max_zero.games.{cls.custom_op_name()}.batch_valid_actions_mask",
+            device=DeviceRef.CPU(),
+            values=[games],
+            out_types=[
+                TensorType(
+                    dtype=DType.uint64,
+                    shape=(games.shape[0], cls.mask_words()),
+                    device=DeviceRef.CPU(),
+                )
+            ],
+        )[0].tensor
+
+    @classmethod
+    def batch_terminal_mask(cls, games: Value) -> TensorValue:
+        """Terminal bitmasks of shape [N] for N serialized games."""
+        games = cls._check_serialized_batch(games)
+        return ops.custom(
+            name=f"alpha_max_zero.games.{cls.custom_op_name()}.batch_terminal_mask",
+            device=DeviceRef.CPU(),
+            values=[games],
+            out_types=[
+                TensorType(
+                    dtype=DType.uint32, shape=(games.shape[0],), device=DeviceRef.CPU()
+                )
+            ],
+        )[0].tensor
+
+    @classmethod
+    def _check_serialized_batch(cls, games: Value) -> TensorValue:
+        """Validate a [N, serialized_size] uint8 tensor of serialized games."""
+        assert isinstance(games, TensorValue)
+        if games.dtype != DType.uint8:
+            raise ValueError(f"games must be uint8, got {games.dtype}")
+        if len(games.shape) != 2 or int(games.shape[1]) != cls.serialized_size():
+            raise ValueError(
+                f"games must have shape [N, {cls.serialized_size()}], got {games.shape}"
+            )
+        return games
+
+    def serialize(self) -> TensorValue:
+        """Dump the raw game state into a uint8 tensor of shape [serialized_size]."""
+        return ops.inplace_custom(
+            name=f"alpha_max_zero.games.{self.custom_op_name()}.serialize",
+            device=DeviceRef.CPU(),
+            values=[self.value],
+            out_types=[
+                TensorType(
+                    dtype=DType.uint8,
+                    shape=(self.serialized_size(),),
+                    device=DeviceRef.CPU(),
+                )
+            ],
+        )[0].tensor
+
+    @classmethod
+    def deserialize(cls: type[G], data: Value) -> G:
+        """Restore a game from a uint8 tensor written by `serialize`."""
+        assert isinstance(data, TensorValue)
+        if data.dtype != DType.uint8:
+            raise ValueError(f"data must be uint8, got {data.dtype}")
+        if len(data.shape) != 1 or int(data.shape[0]) != cls.serialized_size():
+            raise ValueError(
+                f"data must have shape [{cls.serialized_size()}], got {data.shape}"
+            )
+
+        return cls(
+            ops.custom(
+                name=f"alpha_max_zero.games.{cls.custom_op_name()}.deserialize",
+                device=DeviceRef.CPU(),
+                values=[data],
+                out_types=[cls.opaque_type()],
+            )[0].opaque
+        )
+
+    @classmethod
+    def deserialize_batch(cls: type[G], data: Value) -> list[G]:
+        """Restore N games from a [N, serialized_size] tensor from `serialize_batch`."""
+        assert isinstance(data, TensorValue)
+        if len(data.shape) != 2:
+            raise ValueError(f"data must be rank 2, got shape {data.shape}")
+
+        return [cls.deserialize(data[i]) for i in range(int(data.shape[0]))]
+
+    @classmethod
+    def rollout(
+        cls, games: Value, rng: PCGRandom, trace_length: int | None = None
+    ) -> list[TensorValue]:
+        """Play N games to completion with uniformly random valid moves.
+
+        The whole rollout runs inside a single custom op.
+        To roll out one position many times, serialize it repeatedly,
+        e.g. `serialize_batch([g] * n)`.
+
+        Args:
+            games: uint8 tensor of shape [N, serialized_size] of starting positions.
+            rng: Random generator used to pick moves.
+            trace_length: If set, also record up to this many actions per game.
+
+        Returns:
+            - results: bool [N, num_players + 1] in the same format as `is_terminal`.
+            - lengths: uint32 [N] number of moves played in each rollout.
+            - actions: uint16 [N, trace_length] played actions, only if
+              `trace_length` is set. Unused slots are filled with `num_actions`.
+        """
+        games = cls._check_serialized_batch(games)
+        n = games.shape[0]
+        out_types = [
+            TensorType(
+                dtype=DType.bool,
+                shape=(n, cls.num_players() + 1),
+                device=DeviceRef.CPU(),
+            ),
+            TensorType(dtype=DType.uint32, shape=(n,), device=DeviceRef.CPU()),
+        ]
+        name = f"alpha_max_zero.games.{cls.custom_op_name()}.rollout"
+        if trace_length is not None:
+            name += "_with_actions"
+            out_types.append(
+                TensorType(
+                    dtype=DType.uint16,
+                    shape=(n, trace_length),
+                    device=DeviceRef.CPU(),
+                )
+            )
+
+        return [
+            v.tensor
+            for v in ops.inplace_custom(
+                name=name,
+                device=DeviceRef.CPU(),
+                values=[rng.value, games],
+                out_types=out_types,
+            )
+        ]
+
+
+def serialize_batch(games: Sequence[Game]) -> TensorValue:
+    """Dump N games into a single [N, serialized_size] uint8 tensor."""
+    return ops.stack([g.serialize() for g in games])
+
 
 class TicTacToeGame(Game):
     """Tic tac toe game graph value."""
@@ -142,3 +336,7 @@ class TicTacToeGame(Game):
     @staticmethod
     def num_actions() -> int:
         return 9
+
+    @staticmethod
+    def serialized_size() -> int:
+        return 4
@@ -15,6 +15,7 @@ from max.graph import (
     TensorType,
     TensorValue,
     ShapeLike,
+    Value,
 )
 
 
@@ -41,7 +42,10 @@ class PCGRandom:
     """The OpaqueValue representing the PCG state in the graph."""
 
     def __init__(
-        self, seed: Union[int, TensorValue] = 0, stream: Union[int, TensorValue] = 1
+        self,
+        seed: Union[int, TensorValue] = 0,
+        stream: Union[int, TensorValue] = 1,
+        opaque_value: Value | None = None,
     ):
         """Initialize a new PCG random number generator.
 
@@ -50,7 +54,14 @@ class PCGRandom:
             stream: Stream number for independent random sequences. Can be int or TensorValue
                    with dtype uint64 and scalar shape. Each stream produces a different,
                    independent sequence of random numbers.
+            opaque_value: An existing PCGState OpaqueValue to wrap instead of creating
+                   a new generator. If set, seed and stream are ignored.
         """
+        if opaque_value:
+            assert isinstance(opaque_value, _OpaqueValue)
+            self.value = opaque_value
+            return
+
         if isinstance(seed, int):
             seed = ops.constant(seed, DType.uint64, DeviceRef.CPU())
 
@@ -74,6 +85,14 @@ class PCGRandom:
             out_types=[_OpaqueType("PCGState")],
         )[0].opaque
 
+    @staticmethod
+    def serialized_size() -> int:
+        """Returns the number of bytes in a serialized PCG state.
+
+        The state and increment are both 64 bits.
+        """
+        return 16
+
     def seed(self, seed: int) -> None:
         """Re-seed the generator with a new seed value.
 
@@ -92,6 +111,49 @@ class PCGRandom:
             ],
         )
 
+    def serialize(self) -> TensorValue:
+        """Dump the raw generator state into a uint8 tensor of shape [serialized_size].
+
+        Together with `deserialize`, this allows resuming a random sequence exactly
+        where it left off, e.g. after restarting a self-play run.
+        """
+        return ops.inplace_custom(
+            name="alpha_max_zero.random.pcg.serialize",
+            device=DeviceRef.CPU(),
+            values=[self.value],
+            out_types=[
+                TensorType(
+                    dtype=DType.uint8,
+                    shape=(self.serialized_size(),),
+                    device=DeviceRef.CPU(),
+                )
+            ],
+        )[0].tensor
+
+    @classmethod
+    def deserialize(cls, data: Value) -> "PCGRandom":
+        """Restore a generator from a uint8 tensor written by `serialize`.
+
+        Args:
+            data: TensorValue with dtype uint8 and shape [serialized_size].
+        """
+        assert isinstance(data, TensorValue)
+        if data.dtype != DType.uint8:
+            raise ValueError(f"data must be uint8, got {data.dtype}")
+        if len(data.shape) != 1 or int(data.shape[0]) != cls.serialized_size():
+            raise ValueError(
+                f"data must have shape [{cls.serialized_size()}], got {data.shape}"
+            )
+
+        return cls(
+            opaque_value=ops.custom(
+                name="alpha_max_zero.random.pcg.deserialize",
+                device=DeviceRef.CPU(),
+                values=[data],
+                out_types=[_OpaqueType("PCGState")],
+            )[0].opaque
+        )
+
     def uniform(
         self, low: float = 0.0, high: float = 1.0, shape: ShapeLike = []
     ) -> TensorValue:
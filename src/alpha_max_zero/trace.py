@@ -0,0 +1,293 @@
+"""Timeline tracing for graph executions and pipeline stages.
+
+Spans are recorded into a ring buffer with their thread id and exported as
+Chrome trace JSON. The output can be loaded in https://ui.perfetto.dev or
+chrome://tracing to see where wall time goes across threads.
+
+Tracing is off by default. When disabled, `span` returns a shared no-op context
+manager, so instrumented code only pays for a flag check.
+
+Spans from `span` are exported as slices on their thread, which the viewers
+expect to nest. Work that crosses an `await` can overlap other work on the event
+loop thread, so it should use `async_span` instead. Those spans are exported as
+async events with their own id and are drawn on separate tracks.
+
+Host/device transfers only show up on the timeline if they go through `to_numpy`
+or `to_device`. Copies made inside a graph are part of its `execute` span.
+
+Example:
+    ```python
+    from alpha_max_zero import trace
+
+    trace.enable()
+    model = trace.traced_model(session.load(graph), "play_move")
+    with trace.span("self_play", games=64):
+        model.execute(...)
+    trace.export_chrome_trace("trace.json")
+    ```
+"""
+
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, ContextManager, TypeVar
+
+import numpy as np
+from max.driver import Device, Tensor
+from max.engine import Model  # pyright: ignore[reportPrivateImportUsage]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_CAPACITY = 1 << 16
+"""Default number of spans kept before the oldest ones are dropped."""
+
+_enabled = False
+_events: deque["SpanEvent"] = deque(maxlen=DEFAULT_CAPACITY)
+_thread_names: dict[int, str] = {}
+_null_span = nullcontext()
+# next() on a count is atomic, so ids stay unique across threads.
+_async_ids = itertools.count(1)
+
+
+@dataclass
+class SpanEvent:
+    """A single completed span on the timeline."""
+
+    name: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    args: dict[str, Any] = field(default_factory=dict[str, Any])
+    async_id: int | None = None
+    """Set for spans from `async_span`, which may overlap others on their thread."""
+
+
+class _Span:
+    """Context manager that records a SpanEvent on exit."""
+
+    __slots__ = ("name", "args", "start_ns", "async_id")
+
+    def __init__(
+        self, name: str, args: dict[str, Any], async_id: int | None = None
+    ) -> None:
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+        self.async_id = async_id
+
+    def __enter__(self) -> "_Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        end_ns = time.perf_counter_ns()
+        # get_ident() is reused as soon as a thread exits, the native id is not.
+        thread_id = threading.get_native_id()
+        _thread_names[thread_id] = threading.current_thread().name
+        # deque.append is atomic, so no lock is needed across threads.
+        _events.append(
+            SpanEvent(
+                self.name, self.start_ns, end_ns, thread_id, self.args, self.async_id
+            )
+        )
+
+
+def enable(capacity: int | None = None) -> None:
+    """Start recording spans, keeping at most `capacity` of the newest ones.
+
+    If `capacity` is None, the current capacity is kept.
+    """
+    global _enabled, _events
+    if capacity is not None and capacity != _events.maxlen:
+        _events = deque(_events, maxlen=capacity)
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording spans. Already recorded spans are kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Returns whether spans are currently being recorded."""
+    return _enabled
+
+
+def clear() -> None:
+    """Drop all recorded spans."""
+    _events.clear()
+    _thread_names.clear()
+
+
+def events() -> list[SpanEvent]:
+    """Returns a snapshot of the recorded spans, oldest first."""
+    return list(_events)
+
+
+def span(name: str, **args: Any) -> ContextManager[Any]:
+    """Time the enclosed block as a span named `name`.
+
+    Keyword arguments (like `batch_size`) are attached to the span and shown in
+    the trace viewer.
+    """
+    if not _enabled:
+        return _null_span
+    return _Span(name, args)
+
+
+def async_span(name: str, **args: Any) -> ContextManager[Any]:
+    """Time the enclosed block as an async span named `name`.
+
+    Use this instead of `span` when the block awaits. Each async span gets its
+    own id, so spans that overlap on the event loop thread are still drawn
+    correctly.
+    """
+    if not _enabled:
+        return _null_span
+    return _Span(name, args, next(_async_ids))
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """Decorator that records every call of a pipeline stage as a span.
+
+    Coroutine functions are recorded as async spans around the awaited call.
+    """
+
+    def decorator(fn: F) -> F:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _enabled:
+                    return await fn(*args, **kwargs)
+                with _Span(span_name, {}, next(_async_ids)):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # pyright: ignore[reportReturnType]
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(span_name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # pyright: ignore[reportReturnType]
+
+    return decorator
+
+
+def _batch_size(inputs: tuple[Any, ...]) -> int | None:
+    """Guess the batch size as the leading dim of the first tensor input."""
+    for value in inputs:
+        shape = getattr(value, "shape", None)
+        if shape:
+            return int(shape[0])
+    return None
+
+
+class TracedModel:
+    """Wraps a model from `InferenceSession.load` to record each execution.
+
+    All other attributes are forwarded to the wrapped model.
+    """
+
+    def __init__(self, model: Model, name: str) -> None:
+        self.model = model
+        self.name = name
+
+    def execute(self, *inputs: Any) -> list[Any]:
+        if not _enabled:
+            return self.model.execute(*inputs)
+        args: dict[str, Any] = {}
+        batch_size = _batch_size(inputs)
+        if batch_size is not None:
+            args["batch_size"] = batch_size
+        with _Span(self.name, args):
+            return self.model.execute(*inputs)
+
+    def __call__(self, *inputs: Any) -> list[Any]:
+        return self.execute(*inputs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.model, attr)
+
+
+def traced_model(model: Model, name: str) -> TracedModel:
+    """Wrap a loaded model so its `execute` calls show up on the timeline."""
+    return TracedModel(model, name)
+
+
+def to_numpy(tensor: Tensor, name: str = "to_numpy") -> np.ndarray:
+    """Copy a tensor to a numpy array, recording the copy as a span."""
+    if not _enabled:
+        return tensor.to_numpy()
+    with _Span(name, {"shape": list(tensor.shape)}):
+        return tensor.to_numpy()
+
+
+def to_device(tensor: Tensor, device: Device, name: str = "to_device") -> Tensor:
+    """Copy a tensor to `device`, recording the copy as a span."""
+    if not _enabled:
+        return tensor.to(device)
+    with _Span(name, {"shape": list(tensor.shape), "device": str(device)}):
+        return tensor.to(device)
+
+
+def chrome_trace() -> dict[str, Any]:
+    """Build a Chrome trace event dict from the recorded spans."""
+    pid = os.getpid()
+    trace_events: list[dict[str, Any]] = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": thread_id,
+            "args": {"name": thread_name},
+        }
+        for thread_id, thread_name in list(_thread_names.items())
+    ]
+    for event in events():
+        if event.async_id is not None:
+            # Nestable async begin/end pair, matched by category and id.
+            common = {
+                "name": event.name,
+                "cat": "async",
+                "id": event.async_id,
+                "pid": pid,
+                "tid": event.thread_id,
+            }
+            trace_events.append(
+                {**common, "ph": "b", "ts": event.start_ns / 1000, "args": event.args}
+            )
+            trace_events.append({**common, "ph": "e", "ts": event.end_ns / 1000})
+            continue
+        trace_events.append(
+            {
+                "name": event.name,
+                "ph": "X",
+                "ts": event.start_ns / 1000,
+                "dur": (event.end_ns - event.start_ns) / 1000,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": event.args,
+            }
+        )
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path: str | Path) -> None:
+    """Write the recorded spans to `path` as Chrome/Perfetto trace JSON."""
+    with open(path, "w") as f:
+        json.dump(chrome_trace(), f)
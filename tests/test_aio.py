@@ -0,0 +1,217 @@
+"""Tests for the asyncio front-end.
+
+These check that awaitable graph execution overlaps, that requests from many
+coroutines get batched together, and that thousands of games can be driven from
+a single event loop.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from max.driver import Tensor
+from max.dtype import DType
+from max.engine import MojoValue  # pyright: ignore[reportPrivateImportUsage]
+from max.graph import DeviceRef, Graph, TensorType
+
+from alpha_max_zero import game, kernels, trace
+from alpha_max_zero.aio import AsyncModel, BatchEvaluator, run_games
+from alpha_max_zero.kernels import sleep
+
+
+def test_batch_evaluator_batches():
+    """Requests queued in the same loop iteration are evaluated together."""
+    batch_sizes: list[int] = []
+
+    async def evaluate(items: list[int]) -> list[int]:
+        batch_sizes.append(len(items))
+        return [x * 2 for x in items]
+
+    async def main() -> list[int]:
+        evaluator = BatchEvaluator(evaluate, max_batch_size=32)
+        return await run_games(evaluator, 100)
+
+    results = asyncio.run(main())
+
+    assert results == [x * 2 for x in range(100)]
+    assert batch_sizes == [32, 32, 32, 4]
+
+
+def test_batch_evaluator_propagates_errors():
+    async def evaluate(items: list[int]) -> list[int]:
+        raise RuntimeError("evaluation failed")
+
+    async def main():
+        evaluator = BatchEvaluator(evaluate)
+        await asyncio.gather(evaluator(1), evaluator(2))
+
+    with pytest.raises(RuntimeError, match="evaluation failed"):
+        asyncio.run(main())
+
+
+def test_batch_evaluator_cancellation():
+    """Cancelling a batch in flight must not leave its callers waiting."""
+
+    async def main():
+        started = asyncio.Event()
+
+        async def evaluate(items: list[int]) -> list[int]:
+            started.set()
+            await asyncio.Event().wait()
+            return items
+
+        evaluator = BatchEvaluator(evaluate)
+        caller = asyncio.ensure_future(evaluator(1))
+        await started.wait()
+        for task in list(evaluator._tasks):  # pyright: ignore[reportPrivateUsage]
+            task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, timeout=1.0)
+
+    asyncio.run(main())
+
+
+def test_batch_evaluator_traces_concurrent_batches():
+    """Overlapping batches on the event loop thread export as async events."""
+    delays = {2: 0.05, 1: 0.01}
+
+    async def evaluate(items: list[int]) -> list[int]:
+        await asyncio.sleep(delays[len(items)])
+        return items
+
+    async def main():
+        evaluator = BatchEvaluator(evaluate, max_batch_size=2)
+        # The first batch is still running when the second one flushes.
+        first = asyncio.gather(evaluator(1), evaluator(2))
+        await asyncio.sleep(0)
+        second = evaluator(3)
+        await asyncio.gather(first, second)
+
+    trace.clear()
+    trace.enable()
+    try:
+        asyncio.run(main())
+        events = trace.events()
+        data = trace.chrome_trace()
+    finally:
+        trace.disable()
+        trace.clear()
+
+    assert [e.name for e in events] == ["batch_evaluate", "batch_evaluate"]
+    second, first = events
+    assert first.start_ns < second.start_ns < second.end_ns < first.end_ns
+    assert first.thread_id == second.thread_id
+
+    trace_events = data["traceEvents"]
+    assert not [e for e in trace_events if e["ph"] == "X"]
+    begins = {e["id"]: e for e in trace_events if e["ph"] == "b"}
+    ends = {e["id"]: e for e in trace_events if e["ph"] == "e"}
+    assert len(begins) == 2
+    assert begins.keys() == ends.keys()
+    assert sorted(e["args"]["batch_size"] for e in begins.values()) == [1, 2]
+
+
+def test_run_games_max_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def play_game(i: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return i
+
+    results = asyncio.run(run_games(play_game, 50, max_concurrency=8))
+
+    assert results == list(range(50))
+    assert max_in_flight == 8
+
+
+def test_async_model_runs_in_parallel(cpu_inference_session):
+    """Awaiting multiple runs should overlap graph execution."""
+    with Graph(
+        "async_sleep",
+        input_types=[
+            TensorType(dtype=DType.float32, shape=(), device=DeviceRef.CPU()),
+        ],
+        custom_extensions=[kernels.mojo_kernels],
+    ) as graph:
+        graph.output(sleep(graph.inputs[0]))
+
+    model = AsyncModel(cpu_inference_session.load(graph), max_workers=4)
+    sleep_duration = 0.5
+
+    async def main():
+        return await asyncio.gather(*(model.run(sleep_duration) for _ in range(4)))
+
+    start = time.time()
+    results = asyncio.run(main())
+    total_time = time.time() - start
+    model.close()
+
+    assert len(results) == 4
+    for result in results:
+        assert isinstance(result[0], Tensor)
+    assert total_time < sleep_duration * 4 * 0.6, (
+        f"Runs appear to be sequential. Total time: {total_time:.2f}s"
+    )
+
+
+def test_many_async_games(cpu_inference_session):
+    """Play many random games concurrently with a shared batching point."""
+    with Graph("init_game", custom_extensions=[kernels.mojo_kernels]) as init_graph:
+        g = game.TicTacToeGame()
+        init_graph.output(g.value, g.valid_actions())
+
+    with Graph(
+        "play_move",
+        input_types=[
+            TensorType(dtype=DType.uint32, shape=(), device=DeviceRef.CPU()),
+            game.TicTacToeGame.opaque_type(),
+        ],
+        custom_extensions=[kernels.mojo_kernels],
+    ) as action_graph:
+        action, g_raw = action_graph.inputs
+        g = game.TicTacToeGame(g_raw)
+        g.play_action(action)
+        action_graph.output(g.valid_actions(), g.is_terminal())
+
+    init = AsyncModel(cpu_inference_session.load(init_graph))
+    play = AsyncModel(cpu_inference_session.load(action_graph), executor=init.executor)
+
+    batch_sizes: list[int] = []
+    rng = np.random.default_rng(42)
+
+    async def evaluate(masks: list[np.ndarray]) -> list[int]:
+        # Stand-in for a network: pick uniformly among valid actions per game.
+        batch_sizes.append(len(masks))
+        return [int(rng.choice(np.flatnonzero(mask))) for mask in masks]
+
+    evaluator = BatchEvaluator(evaluate, max_batch_size=128)
+
+    async def play_game(_: int) -> np.ndarray:
+        g, valid = await init.run()
+        assert isinstance(g, MojoValue)
+        assert isinstance(valid, Tensor)
+        while True:
+            action = await evaluator(valid.to_numpy())
+            valid, terminal = await play.run(action, g)
+            assert isinstance(valid, Tensor)
+            assert isinstance(terminal, Tensor)
+            if terminal.to_numpy().any():
+                return terminal.to_numpy()
+
+    num_games = 1000
+    results = asyncio.run(run_games(play_game, num_games, max_concurrency=512))
+    init.close()
+
+    assert len(results) == num_games
+    for terminal in results:
+        assert np.sum(terminal) == 1
+    # Requests from many games should have been grouped together.
+    assert max(batch_sizes) > 1
+    assert sum(batch_sizes) >= num_games * 5
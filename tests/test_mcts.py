@@ -0,0 +1,250 @@
+"""Tests for MCTS internals.
+
+The MCTS is not exposed to python directly, so these run through the test only
+custom ops in src/alpha_max_zero/kernels/testing.mojo.
+"""
+
+import numpy as np
+import pytest
+from max.driver import Tensor
+from max.dtype import DType
+from max.graph import DeviceRef, Graph, TensorType, ops
+
+from alpha_max_zero import game, kernels
+from alpha_max_zero.random import PCGRandom
+
+
+def test_serialize_round_trip(cpu_inference_session):
+    """A serialized tree should restore every column into a fresh MCTS."""
+    checks = [
+        "size",
+        "header",
+        "halving_nodes",
+        "gumbel_noise",
+        "game_states",
+        "parent_index",
+        "pi_logit",
+        "visit_counts",
+        "played_action",
+        "children_index",
+        "children_count",
+        "player_values",
+        "serialized_size",
+        "capacity_grew",
+        "rejects_bad_magic",
+        "rejects_bad_version",
+    ]
+
+    with Graph("mcts_serialize", custom_extensions=[kernels.mojo_kernels]) as graph:
+        policy = ops.constant(
+            np.arange(9, dtype=np.float32), DType.float32, DeviceRef.CPU()
+        )
+        graph.output(
+            ops.custom(
+                name="alpha_max_zero.testing.mcts.serialize_round_trip",
+                device=DeviceRef.CPU(),
+                values=[policy],
+                out_types=[
+                    TensorType(
+                        dtype=DType.bool, shape=(len(checks),), device=DeviceRef.CPU()
+                    )
+                ],
+            )[0].tensor
+        )
+
+    model = cpu_inference_session.load(graph)
+    result = model.execute()[0]
+    assert isinstance(result, Tensor)
+
+    failed = [name for name, ok in zip(checks, result.to_numpy()) if not ok]
+    assert failed == [], f"Columns differ after round trip: {failed}"
+
+
+@pytest.fixture(scope="module")
+def playout_cap_graph(inference_session):
+    """Runs many playout cap randomized search setups for a given full_search_prob."""
+    num_searches = 4000
+
+    with Graph(
+        "mcts_playout_cap",
+        input_types=[
+            TensorType(dtype=DType.float32, shape=(), device=DeviceRef.CPU()),
+        ],
+        custom_extensions=[kernels.mojo_kernels],
+    ) as graph:
+        rng = PCGRandom(seed=42, stream=3)
+        logits = ops.constant(
+            np.zeros(game.TicTacToeGame.num_actions(), dtype=np.float32),
+            DType.float32,
+            DeviceRef.CPU(),
+        )
+        results = ops.inplace_custom(
+            name="alpha_max_zero.testing.mcts.playout_cap",
+            device=DeviceRef.CPU(),
+            values=[rng.value, graph.inputs[0], logits],
+            out_types=[
+                TensorType(
+                    dtype=DType.bool, shape=(num_searches,), device=DeviceRef.CPU()
+                ),
+                TensorType(
+                    dtype=DType.uint32, shape=(num_searches,), device=DeviceRef.CPU()
+                ),
+                TensorType(
+                    dtype=DType.float32,
+                    shape=(game.TicTacToeGame.num_actions(),),
+                    device=DeviceRef.CPU(),
+                ),
+                TensorType(dtype=DType.bool, shape=(1,), device=DeviceRef.CPU()),
+            ],
+        )
+        # Sample the rng afterwards to see how far the stream advanced.
+        graph.output(*[r.tensor for r in results], rng.uniform(shape=(4,)))
+
+    return inference_session.load(graph)
+
+
+def _playout_cap(model, full_search_prob: float) -> list[np.ndarray]:
+    results = model.execute(Tensor.scalar(full_search_prob, DType.float32))
+    for r in results:
+        assert isinstance(r, Tensor)
+    return [r.to_numpy() for r in results]
+
+
+def test_playout_cap_reproducible(playout_cap_graph):
+    full1, sims1, *_ = _playout_cap(playout_cap_graph, 0.25)
+    full2, sims2, *_ = _playout_cap(playout_cap_graph, 0.25)
+
+    np.testing.assert_array_equal(full1, full2)
+    np.testing.assert_array_equal(sims1, sims2)
+
+
+def test_playout_cap_fraction(playout_cap_graph):
+    full, sims, _, _, _ = _playout_cap(playout_cap_graph, 0.25)
+
+    assert abs(full.mean() - 0.25) < 0.03, f"full search fraction {full.mean()}"
+    np.testing.assert_array_equal(sims, np.where(full, 100, 20))
+
+
+def test_playout_cap_extremes(playout_cap_graph):
+    never_full, never_sims, _, _, never_rng = _playout_cap(playout_cap_graph, 0.0)
+    always_full, always_sims, _, _, always_rng = _playout_cap(playout_cap_graph, 1.0)
+    _, _, _, _, mixed_rng = _playout_cap(playout_cap_graph, 0.25)
+
+    assert not never_full.any()
+    assert np.all(never_sims == 20)
+    assert always_full.all()
+    assert np.all(always_sims == 100)
+
+    # The stream advances the same amount regardless of the config.
+    np.testing.assert_array_equal(never_rng, always_rng)
+    np.testing.assert_array_equal(never_rng, mixed_rng)
+
+
+def test_search_policy_reports_training_target(playout_cap_graph):
+    for prob in [0.0, 1.0]:
+        full, _, policy, target, _ = _playout_cap(playout_cap_graph, prob)
+
+        # Action a was given a + 1 visits.
+        expected = np.arange(1, 10, dtype=np.float32) / 45
+        np.testing.assert_allclose(policy, expected, rtol=1e-6)
+        assert target[0] == full[-1] == (prob == 1.0)
+
+
+def _expand(session, actions: list[int], policy: np.ndarray) -> list[np.ndarray]:
+    """Expand a tree rooted at the game after `actions` and return its columns."""
+    max_nodes = 32
+
+    with Graph("mcts_expand", custom_extensions=[kernels.mojo_kernels]) as graph:
+        g = game.TicTacToeGame()
+        for action in actions:
+            g.play_action(action)
+
+        results = ops.inplace_custom(
+            name="alpha_max_zero.testing.mcts.expand",
+            device=DeviceRef.CPU(),
+            values=[g.value, ops.constant(policy, DType.float32, DeviceRef.CPU())],
+            out_types=[
+                TensorType(dtype=DType.uint32, shape=(1,), device=DeviceRef.CPU()),
+                *[
+                    TensorType(dtype=dtype, shape=(max_nodes,), device=DeviceRef.CPU())
+                    for dtype in [
+                        DType.uint32,
+                        DType.uint16,
+                        DType.float32,
+                        DType.uint32,
+                        DType.uint16,
+                    ]
+                ],
+            ],
+        )
+        graph.output(*[r.tensor for r in results])
+
+    model = session.load(graph)
+    results = model.execute()
+    for r in results:
+        assert isinstance(r, Tensor)
+    return [r.to_numpy() for r in results]
+
+
+def test_expand_new_game(cpu_inference_session):
+    """Expanding a new game and its first child must grow past the initial capacity."""
+    policy = np.arange(10, 19, dtype=np.float32)
+    size, parent, action, logit, child_index, child_count = _expand(
+        cpu_inference_session, [], policy
+    )
+
+    # 1 root + 9 children + 8 grandchildren.
+    assert size[0] == 18
+
+    assert child_index[0] == 1
+    assert child_count[0] == 9
+    np.testing.assert_array_equal(parent[1:10], 0)
+    np.testing.assert_array_equal(action[1:10], np.arange(9))
+    np.testing.assert_array_equal(logit[1:10], policy)
+
+    # The first child played action 0, so its children are actions 1 to 8.
+    assert child_index[1] == 10
+    assert child_count[1] == 8
+    np.testing.assert_array_equal(parent[10:18], 1)
+    np.testing.assert_array_equal(action[10:18], np.arange(1, 9))
+    np.testing.assert_array_equal(logit[10:18], policy[1:])
+
+    # Nothing else was expanded.
+    np.testing.assert_array_equal(child_index[2:18], 0)
+
+
+def test_expand_only_reads_valid_logits(cpu_inference_session):
+    """Invalid actions get no children, so their logits are never read."""
+    policy = np.arange(10, 19, dtype=np.float32)
+    policy[[0, 4]] = np.nan
+    size, parent, action, logit, child_index, child_count = _expand(
+        cpu_inference_session, [4, 0], policy
+    )
+
+    root_actions = [1, 2, 3, 5, 6, 7, 8]
+    assert size[0] == 1 + 7 + 6
+    assert child_index[0] == 1
+    assert child_count[0] == len(root_actions)
+    np.testing.assert_array_equal(parent[1:8], 0)
+    np.testing.assert_array_equal(action[1:8], root_actions)
+    np.testing.assert_array_equal(logit[1:8], policy[root_actions])
+
+    # The first child played action 1.
+    assert child_index[1] == 8
+    assert child_count[1] == 6
+    np.testing.assert_array_equal(parent[8:14], 1)
+    np.testing.assert_array_equal(action[8:14], root_actions[1:])
+
+    assert not np.isnan(logit[1:14]).any()
+
+
+def test_expand_terminal(cpu_inference_session):
+    """A won game with free squares left is expanded with no children."""
+    policy = np.zeros(9, dtype=np.float32)
+    size, _, _, _, child_index, child_count = _expand(
+        cpu_inference_session, [4, 0, 6, 1, 2], policy
+    )
+
+    assert size[0] == 1
+    assert child_index[0] != 0, "terminal node should be marked expanded"
+    assert child_count[0] == 0
@@ -205,3 +205,42 @@ def test_pcg_uniform_distribution(cpu_inference_session):
     # With limited samples, just check basic properties
     # Check that we have some spread in values (not all identical)
     assert not np.all(result == result[0]), "Values should not all be identical"
+
+
+def test_pcg_serialize_round_trip(cpu_inference_session):
+    """Test that a restored generator continues the exact same sequence."""
+    with Graph("pcg_save", custom_extensions=[kernels.mojo_kernels]) as save_graph:
+        rng = PCGRandom(seed=42)
+        # Advance the state so we are not just restoring the seed.
+        _ = rng.uniform(shape=(5,))
+        save_graph.output(rng.serialize(), rng.uniform(shape=(10,)))
+
+    with Graph(
+        "pcg_load",
+        input_types=[
+            TensorType(
+                dtype=DType.uint8,
+                shape=(PCGRandom.serialized_size(),),
+                device=DeviceRef.CPU(),
+            ),
+        ],
+        custom_extensions=[kernels.mojo_kernels],
+    ) as load_graph:
+        rng = PCGRandom.deserialize(load_graph.inputs[0])
+        load_graph.output(rng.uniform(shape=(10,)))
+
+    save = cpu_inference_session.load(save_graph)
+    load = cpu_inference_session.load(load_graph)
+
+    data, expected = save.execute()
+    assert isinstance(data, Tensor)
+    assert isinstance(expected, Tensor)
+
+    result = load.execute(data)[0]
+    assert isinstance(result, Tensor)
+
+    np.testing.assert_array_equal(
+        result.to_numpy(),
+        expected.to_numpy(),
+        "Restored generator should continue the same sequence",
+    )
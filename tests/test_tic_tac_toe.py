@@ -7,6 +7,7 @@ from max.engine import MojoValue  # pyright: ignore[reportPrivateImportUsage]
 from max.graph import Graph, TensorType, DeviceRef
 
 from alpha_max_zero import kernels, game
+from alpha_max_zero.random import PCGRandom
 
 
 def test_init(cpu_inference_session):
@@ -117,3 +118,199 @@ def test_game_coordination(cpu_inference_session):
         if terminal.to_numpy()[2]:
             # game was a draw, board must be full
             assert np.sum(valid.to_numpy()) == 0
+
+
+def test_serialize_round_trip(cpu_inference_session):
+    """Serialize a game mid play and make sure it restores to the same state."""
+
+    with Graph("serialize", custom_extensions=[kernels.mojo_kernels]) as save_graph:
+        g = game.TicTacToeGame()
+        g.play_action(4)
+        g.play_action(0)
+        save_graph.output(g.serialize())
+
+    with Graph(
+        "deserialize",
+        input_types=[
+            TensorType(
+                dtype=DType.uint8,
+                shape=(game.TicTacToeGame.serialized_size(),),
+                device=DeviceRef.CPU(),
+            ),
+        ],
+        custom_extensions=[kernels.mojo_kernels],
+    ) as load_graph:
+        g = game.TicTacToeGame.deserialize(load_graph.inputs[0])
+        load_graph.output(g.valid_actions(), g.current_player())
+
+    save = cpu_inference_session.load(save_graph)
+    load = cpu_inference_session.load(load_graph)
+
+    data = save.execute()[0]
+    assert isinstance(data, Tensor)
+    # O in the center, X in the top left, back to player 0.
+    assert data.to_numpy().view(np.uint32)[0] == (1 << 4) | (1 << 17)
+
+    valid, player = load.execute(data)
+    assert isinstance(valid, Tensor)
+    assert isinstance(player, Tensor)
+
+    np.testing.assert_array_equal(
+        valid.to_numpy(),  # pyright: ignore[reportUnknownArgumentType]
+        [False, True, True, True, False, True, True, True, True],
+    )
+    assert player.to_numpy() == 0
+
+
+def test_serialize_batch(cpu_inference_session):
+    """Serialize multiple games into one tensor and restore them all."""
+
+    with Graph("serialize_batch", custom_extensions=[kernels.mojo_kernels]) as graph:
+        games = [game.TicTacToeGame() for _ in range(3)]
+        for i, g in enumerate(games):
+            g.play_action(i)
+
+        data = game.serialize_batch(games)
+        restored = game.TicTacToeGame.deserialize_batch(data)
+        graph.output(data, *[g.valid_actions() for g in restored])
+
+    model = cpu_inference_session.load(graph)
+    data, *valid = model.execute()
+    assert isinstance(data, Tensor)
+    assert data.to_numpy().shape == (3, game.TicTacToeGame.serialized_size())
+
+    for i, v in enumerate(valid):
+        assert isinstance(v, Tensor)
+        expected = np.ones(9, dtype=np.bool_)
+        expected[i] = False
+        np.testing.assert_array_equal(v.to_numpy(), expected)  # pyright: ignore[reportUnknownArgumentType]
+
+
+def _winner(actions: np.ndarray) -> int:
+    """Replay a tic tac toe action trace in numpy and return the terminal index."""
+    lines = [
+        (0, 1, 2),
+        (3, 4, 5),
+        (6, 7, 8),
+        (0, 3, 6),
+        (1, 4, 7),
+        (2, 5, 8),
+        (0, 4, 8),
+        (2, 4, 6),
+    ]
+    board = np.full(9, -1)
+    for i, action in enumerate(actions):
+        board[action] = i % 2
+    for line in lines:
+        if board[line[0]] != -1 and all(board[j] == board[line[0]] for j in line):
+            return int(board[line[0]])
+    return 2
+
+
+def test_rollout(cpu_inference_session):
+    """Play many random games in a single op and validate every trace."""
+    num_games = 1000
+
+    with Graph(
+        "rollout",
+        input_types=[
+            TensorType(
+                dtype=DType.uint8,
+                shape=(num_games, game.TicTacToeGame.serialized_size()),
+                device=DeviceRef.CPU(),
+            ),
+        ],
+        custom_extensions=[kernels.mojo_kernels],
+    ) as graph:
+        rng = PCGRandom(seed=42)
+        graph.output(*game.TicTacToeGame.rollout(graph.inputs[0], rng, trace_length=9))
+
+    model = cpu_inference_session.load(graph)
+
+    # An all zero board is the initial game state.
+    games = Tensor.from_numpy(
+        np.zeros((num_games, game.TicTacToeGame.serialized_size()), dtype=np.uint8)
+    )
+    results, lengths, actions = model.execute(games)
+    assert isinstance(results, Tensor)
+    assert isinstance(lengths, Tensor)
+    assert isinstance(actions, Tensor)
+    results = results.to_numpy()
+    lengths = lengths.to_numpy()
+    actions = actions.to_numpy()
+
+    assert results.shape == (num_games, 3)
+    np.testing.assert_array_equal(results.sum(axis=1), 1)
+    assert np.all((lengths >= 5) & (lengths <= 9))
+
+    for result, length, trace in zip(results, lengths, actions):
+        played = trace[:length]
+        assert len(set(played.tolist())) == length, "actions must not repeat"
+        assert np.all(played < 9)
+        assert np.all(trace[length:] == 9), "unused slots are padded"
+        assert result[_winner(played)]
+
+    # All outcomes should show up with random play.
+    assert results.any(axis=0).all()
+
+
+def test_rollout_from_position(cpu_inference_session):
+    """Rollouts continue from the given position instead of a new game."""
+    with Graph("rollout_position", custom_extensions=[kernels.mojo_kernels]) as graph:
+        g = game.TicTacToeGame()
+        g.play_action(4)
+        rng = PCGRandom(seed=7)
+        graph.output(
+            *game.TicTacToeGame.rollout(
+                game.serialize_batch([g] * 16), rng, trace_length=9
+            )
+        )
+
+    model = cpu_inference_session.load(graph)
+    _, lengths, actions = model.execute()
+    assert isinstance(lengths, Tensor)
+    assert isinstance(actions, Tensor)
+
+    lengths = lengths.to_numpy()
+    actions = actions.to_numpy()
+    assert np.all((lengths >= 4) & (lengths <= 8))
+    for length, trace in zip(lengths, actions):
+        assert 4 not in trace[:length].tolist()
+
+
+def test_bitmasks(cpu_inference_session):
+    """Bit packed masks should match the bool tensor ops."""
+    with Graph("bitmasks", custom_extensions=[kernels.mojo_kernels]) as graph:
+        g = game.TicTacToeGame()
+        g.play_action(4)
+        g.play_action(0)
+
+        won = game.TicTacToeGame()
+        for action in [4, 0, 6, 1, 2]:
+            won.play_action(action)
+
+        games = game.serialize_batch([game.TicTacToeGame(), g, won])
+        graph.output(
+            g.valid_actions_mask(),
+            g.terminal_mask(),
+            won.terminal_mask(),
+            game.TicTacToeGame.batch_valid_actions_mask(games),
+            game.TicTacToeGame.batch_terminal_mask(games),
+        )
+
+    model = cpu_inference_session.load(graph)
+    results = model.execute()
+    for result in results:
+        assert isinstance(result, Tensor)
+    valid, terminal, won_terminal, batch_valid, batch_terminal = [
+        r.to_numpy()  # pyright: ignore[reportAttributeAccessIssue]
+        for r in results
+    ]
+
+    # Everything but the center (4) and top left (0).
+    assert valid.tolist() == [0b1_1110_1110]
+    assert terminal == 0
+    assert won_terminal == 0b001
+
+    assert batch_valid.tolist() == [[0b1_1111_1111], [0b1_1110_1110], [0b1_1010_1000]]
+    assert batch_terminal.tolist() == [0, 0, 0b001]
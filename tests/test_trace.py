@@ -0,0 +1,179 @@
+"""Tests for the timeline tracer and its Chrome trace export."""
+
+import asyncio
+import json
+import threading
+
+import numpy as np
+import pytest
+from max.driver import CPU, Tensor
+from max.dtype import DType
+from max.graph import DeviceRef, Graph, TensorType
+
+from alpha_max_zero import kernels, trace
+from alpha_max_zero.kernels import sleep
+
+
+@pytest.fixture(autouse=True)
+def clean_tracer():
+    """Make sure every test starts and ends with an empty, disabled tracer."""
+    trace.disable()
+    trace.clear()
+    yield
+    trace.disable()
+    trace.clear()
+
+
+def test_disabled_records_nothing():
+    with trace.span("ignored", batch_size=4):
+        pass
+
+    assert trace.events() == []
+
+
+def test_ring_buffer_keeps_newest():
+    trace.enable(capacity=3)
+    for i in range(5):
+        with trace.span(f"span_{i}"):
+            pass
+
+    assert [e.name for e in trace.events()] == ["span_2", "span_3", "span_4"]
+
+
+def test_enable_keeps_capacity():
+    trace.enable(capacity=3)
+    trace.disable()
+    trace.enable()
+    for i in range(5):
+        with trace.span(f"span_{i}"):
+            pass
+
+    assert len(trace.events()) == 3
+
+
+def test_spans_record_threads():
+    trace.enable()
+    # Keep all threads alive at once so none of them can reuse another's id.
+    barrier = threading.Barrier(3)
+
+    @trace.traced("stage")
+    def stage():
+        barrier.wait()
+
+    threads = [threading.Thread(target=stage, name=f"worker_{i}") for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    events = trace.events()
+    assert len(events) == 3
+    assert all(e.end_ns >= e.start_ns for e in events)
+
+    data = trace.chrome_trace()
+    names = {e["tid"]: e["args"]["name"] for e in data["traceEvents"] if e["ph"] == "M"}
+    assert sorted(names[e.thread_id] for e in events) == [
+        "worker_0",
+        "worker_1",
+        "worker_2",
+    ]
+
+
+def test_chrome_trace_export(tmp_path):
+    trace.enable()
+    with trace.span("encode", batch_size=8):
+        pass
+
+    path = tmp_path / "trace.json"
+    trace.export_chrome_trace(path)
+    data = json.loads(path.read_text())
+
+    spans = [e for e in data["traceEvents"] if e["ph"] == "X"]
+    assert len(spans) == 1
+    assert spans[0]["name"] == "encode"
+    assert spans[0]["args"] == {"batch_size": 8}
+    assert spans[0]["dur"] >= 0
+
+    names = [e for e in data["traceEvents"] if e["ph"] == "M"]
+    assert names[0]["args"]["name"] == threading.current_thread().name
+
+
+def test_async_spans_export_as_async_events():
+    """Overlapping spans on the event loop thread must not be exported as slices."""
+    trace.enable()
+
+    @trace.traced("stage")
+    async def stage(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    async def batch(delay: float) -> None:
+        with trace.async_span("batch", delay=delay):
+            await stage(delay)
+
+    async def main():
+        await asyncio.gather(batch(0.02), batch(0.01))
+
+    asyncio.run(main())
+
+    events = trace.events()
+    assert len(events) == 4
+    assert all(e.async_id is not None for e in events)
+    assert len({e.async_id for e in events}) == 4
+    # The two batches overlap on the same thread.
+    assert len({e.thread_id for e in events}) == 1
+
+    trace_events = trace.chrome_trace()["traceEvents"]
+    assert not [e for e in trace_events if e["ph"] == "X"]
+    begins = {e["id"]: e for e in trace_events if e["ph"] == "b"}
+    ends = {e["id"]: e for e in trace_events if e["ph"] == "e"}
+    assert begins.keys() == ends.keys() == {e.async_id for e in events}
+    for async_id, begin in begins.items():
+        end = ends[async_id]
+        assert begin["name"] == end["name"]
+        assert begin["cat"] == end["cat"]
+        assert end["ts"] >= begin["ts"]
+    assert sorted(e["args"].get("delay", 0) for e in begins.values()) == [
+        0,
+        0,
+        0.01,
+        0.02,
+    ]
+
+
+def test_traced_transfers():
+    trace.enable()
+    data = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+    tensor = trace.to_device(Tensor.from_numpy(data), CPU(), name="upload")
+    result = trace.to_numpy(tensor, name="download")
+
+    np.testing.assert_array_equal(result, data)
+    events = trace.events()
+    assert [e.name for e in events] == ["upload", "download"]
+    assert all(e.args["shape"] == [2, 3] for e in events)
+
+
+def test_traced_model(cpu_inference_session):
+    with Graph(
+        "traced_sleep",
+        input_types=[
+            TensorType(dtype=DType.float32, shape=(), device=DeviceRef.CPU()),
+        ],
+        custom_extensions=[kernels.mojo_kernels],
+    ) as graph:
+        graph.output(sleep(graph.inputs[0]))
+
+    model = trace.traced_model(cpu_inference_session.load(graph), "sleep")
+
+    # Nothing is recorded until tracing is enabled.
+    model.execute(0.0)
+    assert trace.events() == []
+
+    trace.enable()
+    model.execute(0.01)
+    model(0.01)
+
+    events = trace.events()
+    assert [e.name for e in events] == ["sleep", "sleep"]
+    assert all(e.end_ns - e.start_ns >= 10_000_000 for e in events)